@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import functools
+import json
 import os
 import re
 import subprocess
 from pathlib import Path
+from typing import Optional
+
+from config_store import user_config_dir
 
 APP_NAME = "reSink"
 REPO_URL = "https://github.com/Retzilience/reSink"
@@ -11,9 +16,11 @@ REPO_URL = "https://github.com/Retzilience/reSink"
 # I keep this updated (or override via env/build tooling).
 VERSION = "0.2"
 
-_HASH_RE = re.compile(r"^[0-9a-f]{7,40}$", re.IGNORECASE)
+_HASH_RE = re.compile(r"[0-9a-f]{7,40}", re.IGNORECASE)
 _TAG_LONG_RE = re.compile(r"^(\d+(?:\.\d+)*)(?:-(\d+)-g([0-9a-f]{7,40}))?$", re.IGNORECASE)
 
+_VERSION_CACHE_FILENAME = "version-cache.json"
+
 
 def _with_dirty(ver: str, dirty: bool) -> str:
     if not dirty:
@@ -21,6 +28,7 @@ def _with_dirty(ver: str, dirty: bool) -> str:
     return f"{ver}.dirty" if "+" in ver else f"{ver}+dirty"
 
 
+@functools.lru_cache(maxsize=64)
 def _normalize_git_describe(raw: str) -> str:
     s = (raw or "").strip()
     if not s:
@@ -42,7 +50,7 @@ def _normalize_git_describe(raw: str) -> str:
             v = base
         return _with_dirty(v, dirty)
 
-    if _HASH_RE.match(s):
+    if _HASH_RE.fullmatch(s):
         v = f"{str(VERSION).strip() or '0'}+g{s}"
         return _with_dirty(v, dirty)
 
@@ -50,7 +58,125 @@ def _normalize_git_describe(raw: str) -> str:
     return _with_dirty(v, dirty)
 
 
+def _find_git_dir(root: Path) -> Optional[Path]:
+    for base in (root, root.parent):
+        g = base / ".git"
+        if g.is_dir():
+            return g
+        if g.is_file():
+            # Worktrees/submodules use a "gitdir: <path>" pointer file.
+            txt = g.read_text(encoding="utf-8").strip()
+            if txt.startswith("gitdir:"):
+                return (base / txt[len("gitdir:"):].strip()).resolve()
+    return None
+
+
+def _common_git_dir(git_dir: Path) -> Path:
+    # Worktrees keep refs in the shared dir named by "commondir".
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        return (git_dir / commondir.read_text(encoding="utf-8").strip()).resolve()
+    return git_dir
+
+
+def _tags_stamp(git_dir: Path) -> str:
+    """
+    I fingerprint the tag refs by mtime, so a tag added on the current commit invalidates the cache.
+    """
+    common = _common_git_dir(git_dir)
+    parts = []
+    for p in (common / "refs" / "tags", common / "packed-refs"):
+        try:
+            parts.append(str(p.stat().st_mtime_ns))
+        except OSError:
+            parts.append("-")
+    return ":".join(parts)
+
+
+def _fast_head_sha(git_dir: Path) -> str:
+    """
+    I resolve HEAD to a commit sha by reading .git files directly (no git subprocess).
+    """
+    head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    if not head.startswith("ref:"):
+        return head if _HASH_RE.fullmatch(head) else ""
+
+    ref = head[len("ref:"):].strip()
+    common = _common_git_dir(git_dir)
+
+    for d in (git_dir, common):
+        f = d / ref
+        if f.is_file():
+            sha = f.read_text(encoding="utf-8").strip()
+            return sha if _HASH_RE.fullmatch(sha) else ""
+
+    packed = common / "packed-refs"
+    if packed.is_file():
+        for line in packed.read_text(encoding="utf-8").splitlines():
+            if not line or line[0] in "#^":
+                continue
+            sha, _, name = line.partition(" ")
+            if name.strip() == ref:
+                return sha if _HASH_RE.fullmatch(sha) else ""
+    return ""
+
+
+def _version_cache_path() -> Path:
+    return user_config_dir(APP_NAME) / _VERSION_CACHE_FILENAME
+
+
+def _read_cached_describe(key: str) -> str:
+    try:
+        data = json.loads(_version_cache_path().read_text(encoding="utf-8"))
+    except Exception:
+        return ""
+    if not isinstance(data, dict) or data.get("key") != key:
+        return ""
+    return str(data.get("described") or "").strip()
+
+
+def _write_cached_describe(key: str, described: str) -> None:
+    path = _version_cache_path()
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"key": key, "described": described}, f)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            tmp.unlink()
+        except Exception:
+            pass
+
+
+def _git_describe(root: Path) -> str:
+    # No --dirty here: this output only depends on HEAD and the tags, which is what the cache is keyed by.
+    p = subprocess.run(
+        ["git", "describe", "--tags", "--always"],
+        cwd=str(root),
+        capture_output=True,
+        text=True,
+    )
+    if p.returncode != 0:
+        return ""
+    return (p.stdout or "").strip()
+
+
+def _git_is_dirty(root: Path) -> bool:
+    # Same notion of dirty as "git describe --dirty": tracked changes only, index refreshed first.
+    p = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=no"],
+        cwd=str(root),
+        capture_output=True,
+        text=True,
+    )
+    return p.returncode == 0 and bool((p.stdout or "").strip())
+
+
+@functools.lru_cache(maxsize=1)
 def detect_version() -> str:
+    # I only resolve this once per process; env/metadata/git do not change under a running app.
     v = (os.environ.get("RESINK_VERSION") or "").strip()
     if v:
         return v
@@ -71,17 +197,26 @@ def detect_version() -> str:
 
     try:
         root = Path(__file__).resolve().parent
-        if (root / ".git").exists() or (root.parent / ".git").exists():
-            p = subprocess.run(
-                ["git", "describe", "--tags", "--dirty", "--always"],
-                cwd=str(root),
-                capture_output=True,
-                text=True,
-            )
-            if p.returncode == 0:
-                gd = (p.stdout or "").strip()
-                if gd:
-                    return _normalize_git_describe(gd)
+        git_dir = _find_git_dir(root)
+        if git_dir is not None:
+            # I key the describe output by HEAD sha plus the tag refs, so git describe only runs after a
+            # checkout/commit/tag. The dirty state cannot be derived from HEAD, so I check it every time.
+            try:
+                key = f"{_fast_head_sha(git_dir)}@{_tags_stamp(git_dir)}"
+                if key.startswith("@"):
+                    key = ""
+            except Exception:
+                key = ""
+
+            gd = _read_cached_describe(key) if key else ""
+            if not gd:
+                gd = _git_describe(root)
+                if gd and key:
+                    _write_cached_describe(key, gd)
+            if gd:
+                if _git_is_dirty(root):
+                    gd += "-dirty"
+                return _normalize_git_describe(gd)
     except Exception:
         pass
 
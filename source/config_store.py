@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import configparser
+import functools
+import io
 import os
 import platform
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 
 DEFAULT_CONFIG_TEXT = """\
 [Patchbay]
@@ -17,6 +20,13 @@ info =
 last_exe_path =
 """
 
+_DEFAULT_CONFIG_BYTES = DEFAULT_CONFIG_TEXT.encode("utf-8")
+
+_REQUIRED_KEYS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Patchbay", ("selected_app", "custom_path", "info")),
+    ("App", ("last_exe_path",)),
+)
+
 
 def _windows_appdata_dir() -> Path:
     appdata = os.environ.get("APPDATA")
@@ -33,11 +43,14 @@ def _linux_xdg_config_dir() -> Path:
     return Path.home() / ".config"
 
 
+_SYS = platform.system().lower()
+
+
+@functools.lru_cache(maxsize=None)
 def user_config_dir(app_name: str) -> Path:
-    sysname = platform.system().lower()
-    if sysname.startswith("windows"):
+    if _SYS.startswith("windows"):
         return _windows_appdata_dir() / app_name
-    if sysname.startswith("linux"):
+    if _SYS.startswith("linux"):
         return _linux_xdg_config_dir() / app_name
     return Path.home() / ".config" / app_name
 
@@ -58,11 +71,28 @@ def detect_executable_path() -> str:
         return ""
 
 
+def _copy_config(src: configparser.ConfigParser) -> configparser.ConfigParser:
+    dst = configparser.ConfigParser()
+    dst.read_dict(src)
+    return dst
+
+
+def _serialize_config(cfg: configparser.ConfigParser) -> str:
+    buf = io.StringIO()
+    cfg.write(buf)
+    return buf.getvalue()
+
+
 @dataclass(frozen=True)
 class ConfigStore:
     app_name: str = "reSink"
     filename: str = "resink.cfg"
 
+    # I cache the parsed file keyed by st_mtime_ns; callers always get a private copy they may mutate.
+    _cached_cfg: Optional[configparser.ConfigParser] = field(default=None, init=False, repr=False, compare=False)
+    _cached_mtime: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def dir_path(self) -> Path:
         return user_config_dir(self.app_name)
@@ -74,38 +104,75 @@ class ConfigStore:
     def ensure_exists(self) -> None:
         self.dir_path.mkdir(parents=True, exist_ok=True)
         if not self.file_path.exists():
-            self.file_path.write_text(DEFAULT_CONFIG_TEXT, encoding="utf-8")
+            self.file_path.write_bytes(_DEFAULT_CONFIG_BYTES)
+
+    def _mtime_ns(self) -> Optional[int]:
+        try:
+            return self.file_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _remember(self, cfg: configparser.ConfigParser, text: str, mtime: Optional[int]) -> None:
+        object.__setattr__(self, "_cached_cfg", _copy_config(cfg))
+        object.__setattr__(self, "_cached_text", text)
+        object.__setattr__(self, "_cached_mtime", mtime)
 
     def load(self) -> configparser.ConfigParser:
         self.ensure_exists()
-        cfg = configparser.ConfigParser()
-        cfg.read(self.file_path, encoding="utf-8")
 
-        if not cfg.has_section("Patchbay"):
-            cfg.add_section("Patchbay")
-        cfg.set("Patchbay", "selected_app", cfg.get("Patchbay", "selected_app", fallback=""))
-        cfg.set("Patchbay", "custom_path", cfg.get("Patchbay", "custom_path", fallback=""))
-        cfg.set("Patchbay", "info", cfg.get("Patchbay", "info", fallback=""))
+        mtime = self._mtime_ns()
+        if mtime is not None and mtime == self._cached_mtime and self._cached_cfg is not None:
+            return _copy_config(self._cached_cfg)
 
-        if not cfg.has_section("App"):
-            cfg.add_section("App")
-        cfg.set("App", "last_exe_path", cfg.get("App", "last_exe_path", fallback=""))
+        text = self.file_path.read_text(encoding="utf-8")
+        cfg = configparser.ConfigParser()
+        cfg.read_string(text, source=str(self.file_path))
+
+        # I only fill in keys that are missing; existing values are left untouched.
+        for section, keys in _REQUIRED_KEYS:
+            if not cfg.has_section(section):
+                cfg.add_section(section)
+            for key in keys:
+                if not cfg.has_option(section, key):
+                    cfg.set(section, key, "")
 
-        return cfg
+        self._remember(cfg, text, mtime)
+        return _copy_config(cfg)
 
     def save(self, cfg: configparser.ConfigParser) -> None:
         self.ensure_exists()
-        with self.file_path.open("w", encoding="utf-8") as f:
-            cfg.write(f)
+
+        text = _serialize_config(cfg)
+        mtime = self._mtime_ns()
+        if mtime is not None and mtime == self._cached_mtime and text == self._cached_text:
+            # I skip no-op writes; the file on disk already holds exactly this content.
+            return
+
+        # I write to a sibling temp file and swap it in, so a crash mid-write never leaves a truncated config.
+        tmp = self.file_path.with_suffix(self.file_path.suffix + ".tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.file_path)
+        except BaseException:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            raise
+        self._remember(cfg, text, self._mtime_ns())
 
     def record_last_exe_path(self) -> None:
         """
         I write the current executable path into config so future updates can find the installed location.
         """
-        cfg = self.load()
         p = detect_executable_path().strip()
         if not p:
             return
+
+        cfg = self.load()
         if not cfg.has_section("App"):
             cfg.add_section("App")
         if cfg.get("App", "last_exe_path", fallback="").strip() != p:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
 from PySide6.QtWidgets import (
     QAbstractSpinBox,
     QCheckBox,
@@ -15,14 +15,28 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-import pulsectl
 
-from resink_backend import (
-    create_virtual_sink,
-    set_default_sink,
-    suggest_resink_name,
-    wait_for_sink_to_appear,
-)
+class _SuggestNameSignals(QObject):
+    done = Signal(str)
+
+
+class _SuggestNameTask(QRunnable):
+    """
+    I refresh the suggested sink name on a pool thread, since it needs a PulseAudio round trip.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _SuggestNameSignals()
+
+    def run(self) -> None:
+        from resink_backend import suggest_resink_name
+
+        try:
+            name = suggest_resink_name()
+        except Exception:
+            return
+        self.signals.done.emit(name)
 
 
 class CreateVirtualSinkDialog(QDialog):
@@ -49,10 +63,11 @@ class CreateVirtualSinkDialog(QDialog):
         form.setVerticalSpacing(10)
         outer.addLayout(form)
 
-        try:
-            suggested = suggest_resink_name()
-        except pulsectl.PulseError:
-            suggested = "reSink"
+        # I fill the name from the cache (fed by the main window's sink list) so the dialog opens without
+        # a PulseAudio round trip; a stale value is refreshed in the background.
+        from resink_backend import suggest_resink_name_cached
+
+        suggested, stale = suggest_resink_name_cached()
 
         self.sink_name_input = QLineEdit(suggested)
         self.sink_name_input.setMinimumWidth(360)
@@ -84,7 +99,19 @@ class CreateVirtualSinkDialog(QDialog):
         btns.addStretch(1)
         outer.addLayout(btns)
 
+        if stale:
+            task = _SuggestNameTask()
+            task.signals.done.connect(self._on_suggested_name)
+            QThreadPool.globalInstance().start(task)
+
+    def _on_suggested_name(self, name: str) -> None:
+        # I never overwrite a name the user already typed.
+        if name and not self.sink_name_input.isModified():
+            self.sink_name_input.setText(name)
+
     def _create_clicked(self) -> None:
+        from resink_backend import create_virtual_sink, set_default_sink, wait_for_sink_to_appear
+
         name = self.sink_name_input.text().strip()
         if not name:
             QMessageBox.warning(self, "Invalid name", "Sink name cannot be empty.")
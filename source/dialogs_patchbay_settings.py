@@ -20,6 +20,15 @@ from config_store import ConfigStore
 from patchbay import find_asyphon_launch_argv
 
 
+# (key, label, exe) in UI order; aSyphon's installed check is config-based, not PATH-based.
+_PATCHBAY_APPS: tuple[tuple[str, str, str], ...] = (
+    ("asyphon", "aSyphon", ""),
+    ("qpwgraph", "qpwgraph", "qpwgraph"),
+    ("helvum", "helvum", "helvum"),
+    ("patchance", "patchance", "patchance"),
+)
+
+
 class PatchbaySettingsDialog(QDialog):
     """
     I store a patchbay launcher choice.
@@ -33,14 +42,6 @@ class PatchbaySettingsDialog(QDialog):
         self.store = store
         self.config = self.store.load()
 
-        # I keep insertion order here because it is also the UI order.
-        self.applications: dict[str, tuple[str, str]] = {
-            "asyphon": ("aSyphon", ""),  # installed check is config-based, not PATH-based
-            "qpwgraph": ("qpwgraph", "qpwgraph"),
-            "helvum": ("helvum", "helvum"),
-            "patchance": ("patchance", "patchance"),
-        }
-
         layout = QVBoxLayout()
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(10)
@@ -53,36 +54,43 @@ class PatchbaySettingsDialog(QDialog):
         self.button_group.setExclusive(True)
         self.radio_buttons: dict[str, QRadioButton] = {}
 
-        for key, (label, exe) in self.applications.items():
-            rb = QRadioButton(label)
-
-            if key == "asyphon":
-                installed = find_asyphon_launch_argv() is not None
-                rb.setEnabled(installed)
-                if not installed:
-                    rb.setToolTip("aSyphon is not available (no asyphon.cfg with a valid [App] last_exe_path).")
-            else:
-                installed = shutil.which(exe) is not None
-                rb.setEnabled(installed)
-                if not installed:
-                    rb.setToolTip(f"{label} is not installed.")
-
-            self.radio_buttons[key] = rb
-            self.button_group.addButton(rb)
-            form.addRow(rb)
-
-        self.custom_radio = QRadioButton("custom")
-        self.button_group.addButton(self.custom_radio)
-        form.addRow(self.custom_radio)
-
-        self.custom_edit = QLineEdit()
-        browse_btn = QPushButton("Browse")
-        browse_btn.clicked.connect(self._browse_custom)
-        browse = QHBoxLayout()
-        browse.setSpacing(8)
-        browse.addWidget(self.custom_edit)
-        browse.addWidget(browse_btn)
-        form.addRow("Custom path:", browse)
+        # I build all rows with updates suspended so the form lays out and paints once.
+        self.setUpdatesEnabled(False)
+        try:
+            asyphon_installed = find_asyphon_launch_argv() is not None
+
+            for key, label, exe in _PATCHBAY_APPS:
+                rb = QRadioButton(label)
+
+                if key == "asyphon":
+                    installed = asyphon_installed
+                    rb.setEnabled(installed)
+                    if not installed:
+                        rb.setToolTip("aSyphon is not available (no asyphon.cfg with a valid [App] last_exe_path).")
+                else:
+                    installed = shutil.which(exe) is not None
+                    rb.setEnabled(installed)
+                    if not installed:
+                        rb.setToolTip(f"{label} is not installed.")
+
+                self.radio_buttons[key] = rb
+                self.button_group.addButton(rb)
+                form.addRow(rb)
+
+            self.custom_radio = QRadioButton("custom")
+            self.button_group.addButton(self.custom_radio)
+            form.addRow(self.custom_radio)
+
+            self.custom_edit = QLineEdit()
+            browse_btn = QPushButton("Browse")
+            browse_btn.clicked.connect(self._browse_custom)
+            browse = QHBoxLayout()
+            browse.setSpacing(8)
+            browse.addWidget(self.custom_edit)
+            browse.addWidget(browse_btn)
+            form.addRow("Custom path:", browse)
+        finally:
+            self.setUpdatesEnabled(True)
 
         selected_app = (self.config.get("Patchbay", "selected_app", fallback="") or "").strip()
         custom_path = (self.config.get("Patchbay", "custom_path", fallback="") or "").strip()
@@ -101,7 +109,7 @@ class PatchbaySettingsDialog(QDialog):
             done_select = True
 
         if not done_select:
-            for k in self.applications.keys():
+            for k, _label, _exe in _PATCHBAY_APPS:
                 rb = self.radio_buttons.get(k)
                 if rb is not None and rb.isEnabled():
                     rb.setChecked(True)
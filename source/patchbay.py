@@ -1,14 +1,13 @@
 # source/patchbay.py
 from __future__ import annotations
 
-import configparser
 import os
 import platform
-import subprocess
+import stat
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from PySide6.QtWidgets import QMessageBox, QWidget
 
@@ -36,12 +35,13 @@ def _linux_xdg_config_dir() -> Path:
     return Path.home() / ".config"
 
 
-def _candidate_asyphon_cfg_paths() -> List[Path]:
-    sysname = platform.system().lower()
+_SYS = platform.system().lower()
 
-    if sysname.startswith("windows"):
+
+def _compute_asyphon_cfg_paths() -> Tuple[Path, ...]:
+    if _SYS.startswith("windows"):
         base = _windows_appdata_dir()
-    elif sysname.startswith("linux"):
+    elif _SYS.startswith("linux"):
         base = _linux_xdg_config_dir()
     else:
         base = Path.home() / ".config"
@@ -53,44 +53,72 @@ def _candidate_asyphon_cfg_paths() -> List[Path]:
     for d in dirs:
         for fn in files:
             out.append(base / d / fn)
+    return tuple(out)
+
+
+# I resolve the OS branch and aSyphon's candidate cfg paths once; neither changes while the app runs.
+_ASYPHON_CFG_CANDIDATES: Tuple[Path, ...] = _compute_asyphon_cfg_paths()
+
+
+def _candidate_asyphon_cfg_paths() -> Tuple[Path, ...]:
+    return _ASYPHON_CFG_CANDIDATES
+
+
+def _fast_ini_read(path: Path) -> Dict[str, Dict[str, str]]:
+    """
+    I parse the simple INI subset ConfigParser writes ([section], key = value, # / ; comments).
+    Keys are lowercased like ConfigParser's default optionxform; the last duplicate wins.
+    """
+    out: Dict[str, Dict[str, str]] = {}
+    section: Optional[Dict[str, str]] = None
+    for line in path.read_text(encoding="utf-8").splitlines():
+        s = line.strip()
+        if not s or s[0] in "#;":
+            continue
+        if s[0] == "[" and s[-1] == "]":
+            section = out.setdefault(s[1:-1].strip(), {})
+            continue
+        if section is None:
+            continue
+        cuts = [i for i in (s.find("="), s.find(":")) if i > 0]
+        if not cuts:
+            continue
+        cut = min(cuts)
+        section[s[:cut].strip().lower()] = s[cut + 1:].strip()
     return out
 
 
 def _read_asyphon_last_exe_path(cfg_path: Path) -> str:
     try:
-        cp = configparser.ConfigParser()
-        cp.read(cfg_path, encoding="utf-8")
-        return (cp.get("App", "last_exe_path", fallback="") or "").strip()
+        return _fast_ini_read(cfg_path).get("App", {}).get("last_exe_path", "").strip()
     except Exception:
         return ""
 
 
-def _normalize_path(raw: str, *, relative_to: Path) -> Path:
-    p = Path(raw).expanduser()
-    if not p.is_absolute():
-        p = (relative_to / p).resolve()
-    else:
-        p = p.resolve()
-    return p
+def _is_regular_file(p: Path) -> bool:
+    # One stat call instead of exists() + is_file().
+    try:
+        return stat.S_ISREG(os.stat(p).st_mode)
+    except (OSError, ValueError):
+        return False
 
 
-def find_asyphon_launch_argv() -> Optional[List[str]]:
-    """
-    I locate aSyphon via its own config (asyphon.cfg) by reading [App] last_exe_path.
-    If that path points to a .py file, I launch it with sys.executable.
-    """
-    for cfg_path in _candidate_asyphon_cfg_paths():
-        if not cfg_path.exists():
-            continue
+def _normalize_path(raw: str, *, relative_to: Path) -> Path:
+    # I normalize lexically instead of resolve(); the caller's is-file check validates the result.
+    s = os.path.expanduser(raw)
+    if not os.path.isabs(s):
+        s = os.path.join(str(relative_to), s)
+    return Path(os.path.normpath(s))
 
+
+def _scan_asyphon_launch_argv(cfg_paths: Iterable[Path]) -> Optional[List[str]]:
+    for cfg_path in cfg_paths:
         raw = _read_asyphon_last_exe_path(cfg_path)
         if not raw:
             continue
 
         p = _normalize_path(raw, relative_to=cfg_path.parent)
-        if not p.exists():
-            continue
-        if not p.is_file():
+        if not _is_regular_file(p):
             continue
 
         if p.suffix.lower() == ".py":
@@ -100,6 +128,43 @@ def find_asyphon_launch_argv() -> Optional[List[str]]:
     return None
 
 
+# (existing cfg paths with their st_mtime_ns, resolved argv)
+_asyphon_cache: Optional[Tuple[Tuple[Tuple[Path, int], ...], Optional[List[str]]]] = None
+
+
+def find_asyphon_launch_argv() -> Optional[List[str]]:
+    """
+    I locate aSyphon via its own config (asyphon.cfg) by reading [App] last_exe_path.
+    If that path points to a .py file, I launch it with sys.executable.
+    The result is reused until one of the candidate cfg files appears, disappears, or changes mtime,
+    or the resolved executable stops being a regular file.
+    """
+    global _asyphon_cache
+
+    stamps: List[Tuple[Path, int]] = []
+    for cfg_path in _candidate_asyphon_cfg_paths():
+        try:
+            stamps.append((cfg_path, cfg_path.stat().st_mtime_ns))
+        except OSError:
+            continue
+    key = tuple(stamps)
+
+    cached = _asyphon_cache
+    if cached is not None and cached[0] == key and key:
+        # The argv also depends on the target executable, which the cfg mtimes do not cover: I re-check
+        # a cached hit with one stat, and re-scan a cached miss in case the exe has appeared since.
+        argv = cached[1]
+        if argv is None or not _is_regular_file(Path(argv[-1])):
+            cached = None
+
+    if cached is None or cached[0] != key:
+        cached = (key, _scan_asyphon_launch_argv(p for p, _ in key))
+        _asyphon_cache = cached
+
+    argv = cached[1]
+    return list(argv) if argv is not None else None
+
+
 def resolve_patchbay_choice(store: ConfigStore) -> Optional[PatchbayChoice]:
     cfg = store.load()
     selected_app = (cfg.get("Patchbay", "selected_app", fallback="") or "").strip()
@@ -123,7 +188,7 @@ def resolve_patchbay_choice(store: ConfigStore) -> Optional[PatchbayChoice]:
 
         cmd = custom_path.strip()
         p = Path(cmd).expanduser()
-        if p.exists() and p.is_file():
+        if _is_regular_file(p):
             return PatchbayChoice(kind="custom", argv=[str(p.resolve())])
 
         # I keep the old behavior for power users who typed a command string.
@@ -133,12 +198,15 @@ def resolve_patchbay_choice(store: ConfigStore) -> Optional[PatchbayChoice]:
 
 
 def launch_patchbay(choice: PatchbayChoice, parent: QWidget) -> None:
+    import subprocess
+
     if not choice.argv or not (choice.argv[0] or "").strip():
         QMessageBox.critical(parent, "Patchbay", "Invalid patchbay command.")
         return
 
     try:
-        subprocess.Popen(list(choice.argv), close_fds=True)
+        # I detach the patchbay into its own session so it outlives reSink cleanly.
+        subprocess.Popen(choice.argv, close_fds=True, start_new_session=(os.name == "posix"))
     except FileNotFoundError:
         QMessageBox.critical(parent, "Patchbay", f"Command not found:\n\n{choice.argv[0]}")
     except Exception as e:
@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Optional, Sequence
 
+import functools
 import platform
 import sys
 
@@ -45,7 +46,9 @@ class HelpAction:
     tooltip: str = ""
 
 
-def diagnostics_text(project: ReProject) -> str:
+@functools.lru_cache(maxsize=1)
+def _static_diagnostics() -> str:
+    # Platform/Python/UI details are process-invariant; I compute them on first use and keep them.
     qt = "Qt"
     try:
         import PySide6  # noqa: F401
@@ -53,29 +56,36 @@ def diagnostics_text(project: ReProject) -> str:
     except Exception:
         pass
 
+    return (
+        f"Platform: {platform.platform()}\n"
+        f"Python: {sys.version.splitlines()[0]}\n"
+        f"UI: {qt}\n"
+    )
+
+
+def diagnostics_text(project: ReProject) -> str:
     return (
         f"App: {project.name or project.repo}\n"
         f"Version: {project.version}\n"
         f"Repo: {project.repo_url()}\n"
         f"Descriptor: {project.descriptor_url()}\n"
-        f"Platform: {platform.platform()}\n"
-        f"Python: {sys.version.splitlines()[0]}\n"
-        f"UI: {qt}\n"
+        f"{_static_diagnostics()}"
     )
 
 
+def _html_prefix(css: str) -> str:
+    return f"<html><head><style>{css}</style></head><body><div class=\"wrap\">"
+
+
+_HTML_SUFFIX = "</div></body></html>"
+_DEFAULT_HTML_PREFIX = _html_prefix(DEFAULT_CSS)
+
+
 def wrap_help_html(title: str, body_html: str, *, css: str = DEFAULT_CSS) -> str:
     t = title or "Help / About"
     b = body_html or ""
-    return f"""<html>
-<head><style>{css}</style></head>
-<body>
-  <div class="wrap">
-    <h1>{t}</h1>
-    {b}
-  </div>
-</body>
-</html>"""
+    prefix = _DEFAULT_HTML_PREFIX if css is DEFAULT_CSS else _html_prefix(css)
+    return f"{prefix}<h1>{t}</h1>{b}{_HTML_SUFFIX}"
 
 
 class HelpDialog(QDialog):
@@ -105,17 +115,18 @@ class HelpDialog(QDialog):
         header = QHBoxLayout()
         header.setSpacing(10)
 
+        # I style these via the app-wide stylesheet (object-name selectors) instead of per-widget sheets.
         name_lbl = QLabel(project.name or project.repo)
-        name_lbl.setStyleSheet("font-size: 16px; font-weight: 700;")
+        name_lbl.setObjectName("HelpTitle")
         ver_lbl = QLabel(f"v{project.version}")
-        ver_lbl.setStyleSheet("color: #b0b0b0;")
+        ver_lbl.setObjectName("HelpVersion")
 
         header.addWidget(name_lbl)
         header.addWidget(ver_lbl)
         header.addStretch(1)
 
         self._status = QLabel("")
-        self._status.setStyleSheet("color: #b0b0b0;")
+        self._status.setObjectName("HelpStatus")
         header.addWidget(self._status)
 
         outer.addLayout(header)
@@ -124,7 +135,8 @@ class HelpDialog(QDialog):
         self._text.setOpenExternalLinks(False)
         self._text.setOpenLinks(False)
         self._text.anchorClicked.connect(self._on_anchor_clicked)
-        self._text.setHtml(html)
+        # I defer the HTML/CSS parse until the dialog is first shown.
+        self._pending_html: Optional[str] = html
         outer.addWidget(self._text, 1)
 
         btns = QHBoxLayout()
@@ -175,7 +187,17 @@ class HelpDialog(QDialog):
         outer.addLayout(btns)
 
     def set_html(self, html: str) -> None:
-        self._text.setHtml(html)
+        if self.isVisible():
+            self._pending_html = None
+            self._text.setHtml(html)
+        else:
+            self._pending_html = html
+
+    def showEvent(self, event) -> None:
+        if self._pending_html is not None:
+            self._text.setHtml(self._pending_html)
+            self._pending_html = None
+        super().showEvent(event)
 
     def _on_anchor_clicked(self, url: QUrl) -> None:
         try:
@@ -1,11 +1,14 @@
 # source/resink_backend.py
 from __future__ import annotations
 
+import json
 import os
 import subprocess
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pulsectl
 
@@ -19,80 +22,167 @@ class SinkInfo:
 
 
 def _run(cmd: List[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(list(cmd), capture_output=True, text=True)
+    # I decode as UTF-8 explicitly rather than via the locale; PipeWire tools emit UTF-8.
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+    )
+
+
+_PHYSICAL_KEYS = frozenset(("alsa.card", "device.bus", "device.serial"))
+_NULL_FACTORIES = ("null-audio-sink", "module-null-sink")
 
 
 def is_virtual_sink(sink: pulsectl.PulseSinkInfo) -> bool:
     """
     I treat the sink as virtual if it looks like a null sink or it lacks typical physical identifiers.
     """
-    factory = (sink.proplist.get("factory.name", "") or "").lower()
-    if "null-audio-sink" in factory:
-        return True
-    if "module-null-sink" in factory:
+    props = sink.proplist
+    factory = props.get("factory.name", "") or ""
+    if factory and any(n in factory.lower() for n in _NULL_FACTORIES):
         return True
 
-    mc = (sink.proplist.get("media.class", "") or "").lower()
-    if mc == "audio/sink":
-        physical_keys = ["alsa.card", "device.bus", "device.serial"]
-        if not any(key in sink.proplist for key in physical_keys):
-            return True
-    return False
+    # I test the (cheap) key-set check before lowercasing media.class.
+    return _PHYSICAL_KEYS.isdisjoint(props) and (props.get("media.class", "") or "").lower() == "audio/sink"
 
 
-def suggest_resink_name() -> str:
-    """
-    I suggest the next free name in the sequence reSink, reSink-2, reSink-3, ...
-    """
-    base_name = "reSink"
-    with pulsectl.Pulse("resink-manager") as pulse:
-        sinks = pulse.sink_list()
-        existing_names = {s.name for s in sinks}
+_RESINK_BASE_NAME = "reSink"
+
+# Last suggested name and the time.monotonic() stamp it was computed at.
+_suggested_name: Tuple[str, float] = ("", 0.0)
+
 
-    if base_name not in existing_names:
-        return base_name
+def _next_resink_name(existing_names: Iterable[str]) -> str:
+    names = set(existing_names)
+    if _RESINK_BASE_NAME not in names:
+        return _RESINK_BASE_NAME
 
     i = 2
     while True:
-        candidate = f"{base_name}-{i}"
-        if candidate not in existing_names:
+        candidate = f"{_RESINK_BASE_NAME}-{i}"
+        if candidate not in names:
             return candidate
         i += 1
 
 
-def get_sink_node_id_by_name(node_name: str) -> Optional[str]:
+def _remember_suggested_name(existing_names: Iterable[str]) -> str:
+    global _suggested_name
+    name = _next_resink_name(existing_names)
+    _suggested_name = (name, time.monotonic())
+    return name
+
+
+def _invalidate_suggested_name() -> None:
+    # I keep the last name but mark it stale, so the next dialog re-queries PulseAudio.
+    global _suggested_name
+    _suggested_name = (_suggested_name[0], 0.0)
+
+
+@contextmanager
+def _pulse_session(pulse: Optional[pulsectl.Pulse]) -> Iterator[pulsectl.Pulse]:
+    # I use the caller's connection when given one, otherwise a short-lived one.
+    if pulse is not None:
+        yield pulse
+        return
+    with pulsectl.Pulse("resink-manager") as p:
+        yield p
+
+
+def suggest_resink_name(pulse: Optional[pulsectl.Pulse] = None) -> str:
+    """
+    I suggest the next free name in the sequence reSink, reSink-2, reSink-3, ...
     """
-    I resolve PipeWire node id by node.name using pw-cli list-objects output.
+    with _pulse_session(pulse) as pulse:
+        sinks = pulse.sink_list()
+        existing_names = [s.name for s in sinks]
+
+    return _remember_suggested_name(existing_names)
+
+
+def suggest_resink_name_cached(max_age_s: float = 5.0) -> Tuple[str, bool]:
+    """
+    I return the last suggested name without touching PulseAudio, plus whether it is stale.
+    The cache is fed by suggest_resink_name() and by every ReSinkBackend.list_sinks() call.
     """
+    name, stamp = _suggested_name
+    if not name:
+        return _RESINK_BASE_NAME, True
+    return name, (time.monotonic() - stamp) > max_age_s
+
+
+# Parsed node.name -> PipeWire id map and the time.monotonic() stamp it was taken at.
+_PW_CACHE: Dict[str, Any] = {"stamp": 0.0, "map": {}}
+
+
+def _invalidate_pw_cache() -> None:
+    _PW_CACHE["stamp"] = 0.0
+
+
+def _parse_pw_dump(text: str) -> Dict[str, str]:
     try:
-        p = _run(["pw-cli", "list-objects"])
-        if p.returncode != 0:
-            return None
-
-        lines = (p.stdout or "").splitlines()
-        for i, line in enumerate(lines):
-            if f'node.name = "{node_name}"' not in line:
-                continue
-
-            for prev in reversed(lines[:i]):
-                s = prev.strip()
-                if s.startswith("id"):
-                    # Example: "id 56,"
-                    parts = s.replace(",", " ").split()
-                    if len(parts) >= 2 and parts[1].isdigit():
-                        return parts[1]
-                    return None
+        objs = json.loads(text or "[]")
+    except ValueError:
+        return {}
+
+    out: Dict[str, str] = {}
+    for obj in objs if isinstance(objs, list) else ():
+        if not isinstance(obj, dict) or not str(obj.get("type", "")).endswith("Node"):
+            continue
+        props = (obj.get("info") or {}).get("props") or {}
+        name = props.get("node.name")
+        if name and "id" in obj:
+            out.setdefault(str(name), str(obj["id"]))
+    return out
+
+
+def _pw_list_map(ttl: float = 0.5) -> Dict[str, str]:
+    """
+    I run pw-dump at most once per ttl seconds and map every node.name to its id from the JSON dump.
+    """
+    now = time.monotonic()
+    if _PW_CACHE["stamp"] and now - _PW_CACHE["stamp"] < ttl:
+        return _PW_CACHE["map"]
 
+    try:
+        p = _run(["pw-dump", "-N"])
     except FileNotFoundError:
-        return None
+        return {}
+    if p.returncode != 0:
+        return {}
 
-    return None
+    m = _parse_pw_dump(p.stdout or "")
+    _PW_CACHE["map"] = m
+    _PW_CACHE["stamp"] = now
+    return m
+
+
+def get_sink_node_id_by_name(node_name: str) -> Optional[str]:
+    """
+    I resolve PipeWire node id by node.name using (cached) pw-dump output.
+    """
+    return _pw_list_map().get(node_name)
 
 
 def set_default_sink(node_name: str) -> None:
     """
-    I set the default sink via wpctl set-default <node-id>.
+    I set the default sink over the PulseAudio protocol; wpctl set-default <node-id> is the fallback.
     """
+    try:
+        with pulsectl.Pulse("resink-manager") as pulse:
+            for sink in pulse.sink_list():
+                if sink.name == node_name:
+                    pulse.default_set(sink)
+                    return
+    except pulsectl.PulseError:
+        pass
+
+    _set_default_sink_wpctl(node_name)
+
+
+def _set_default_sink_wpctl(node_name: str) -> None:
     sink_id = get_sink_node_id_by_name(node_name)
     if not sink_id:
         raise RuntimeError(f"Sink '{node_name}' not found (cannot set default).")
@@ -127,19 +217,60 @@ def create_virtual_sink(name: str, sample_rate: int) -> None:
         p = _run(["pw-cli", "create-node", "adapter", props])
     except FileNotFoundError as e:
         raise RuntimeError("pw-cli not found in PATH.") from e
+    finally:
+        _invalidate_pw_cache()
+        _invalidate_suggested_name()
 
     if p.returncode != 0:
         msg = (p.stderr or p.stdout).strip()
         raise RuntimeError(msg or "pw-cli create-node failed")
 
 
-def wait_for_sink_to_appear(name: str, tries: int = 15, delay_s: float = 0.12) -> None:
-    with pulsectl.Pulse("resink-manager") as pulse:
-        for _ in range(max(1, tries)):
-            sinks = pulse.sink_list()
-            if any(s.name == name for s in sinks):
-                return
-            time.sleep(max(0.0, delay_s))
+def wait_for_sink_to_appear(
+    name: str,
+    tries: int = 15,
+    delay_s: float = 0.12,
+    pulse: Optional[pulsectl.Pulse] = None,
+) -> None:
+    """
+    I wait (up to tries * delay_s seconds) for a sink "new" event that matches name, instead of polling.
+    """
+    timeout = max(1, tries) * max(0.0, delay_s)
+
+    with _pulse_session(pulse) as pulse:
+        if any(s.name == name for s in pulse.sink_list()):
+            return
+
+        new_indexes: List[int] = []
+
+        def on_event(ev) -> None:
+            if ev.t == "new":
+                new_indexes.append(ev.index)
+                raise pulsectl.PulseLoopStop
+
+        pulse.event_mask_set("sink")
+        pulse.event_callback_set(on_event)
+        try:
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                pulse.event_listen(timeout=remaining)
+                while new_indexes:
+                    try:
+                        if pulse.sink_info(new_indexes.pop()).name == name:
+                            return
+                    except pulsectl.PulseIndexError:
+                        continue
+        finally:
+            pulse.event_callback_set(None)
+            pulse.event_mask_set("null")
+
+        # I do one last scan in case the sink appeared before the subscription was active.
+        if any(s.name == name for s in pulse.sink_list()):
+            return
+
     raise RuntimeError(f"Sink '{name}' did not appear after creation.")
 
 
@@ -155,6 +286,9 @@ def destroy_sink_by_name(node_name: str) -> None:
         p = _run(["pw-cli", "destroy", sink_id])
     except FileNotFoundError as e:
         raise RuntimeError("pw-cli not found in PATH.") from e
+    finally:
+        _invalidate_pw_cache()
+        _invalidate_suggested_name()
 
     if p.returncode != 0:
         msg = (p.stderr or p.stdout).strip()
@@ -164,28 +298,61 @@ def destroy_sink_by_name(node_name: str) -> None:
 class ReSinkBackend:
     def __init__(self, pulse_client_name: str = "resink-gui") -> None:
         self._pulse_client_name = pulse_client_name
+        # I keep one PulseAudio connection for the backend's lifetime; the lock serializes its use
+        # because a pulsectl.Pulse is not safe to share between threads concurrently.
+        self._pulse: Optional[pulsectl.Pulse] = None
+        self._pulse_lock = threading.Lock()
 
     def server_label(self) -> str:
         return "PipeWire (via pipewire-pulse)"
 
+    def _connection(self) -> pulsectl.Pulse:
+        if self._pulse is None:
+            self._pulse = pulsectl.Pulse(self._pulse_client_name)
+        return self._pulse
+
+    def _drop_connection(self) -> None:
+        pulse, self._pulse = self._pulse, None
+        if pulse is not None:
+            try:
+                pulse.close()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        with self._pulse_lock:
+            self._drop_connection()
+
     def list_sinks(self) -> List[SinkInfo]:
-        with pulsectl.Pulse(self._pulse_client_name) as pulse:
-            server = pulse.server_info()
-            default_name = (server.default_sink_name or "").strip()
-
-            out: List[SinkInfo] = []
-            for s in pulse.sink_list():
-                v = is_virtual_sink(s)
-                out.append(
-                    SinkInfo(
-                        name=s.name,
-                        description=s.description or s.name,
-                        is_virtual=v,
-                        is_default=(s.name == default_name),
-                    )
-                )
-            out.sort(key=lambda x: (not x.is_virtual, x.description.lower(), x.name.lower()))
-            return out
+        with self._pulse_lock:
+            try:
+                return self._list_sinks(self._connection())
+            except pulsectl.PulseError:
+                # I reconnect once; the server may have restarted since the last call.
+                self._drop_connection()
+                return self._list_sinks(self._connection())
+
+    def _list_sinks(self, pulse: pulsectl.Pulse) -> List[SinkInfo]:
+        server = pulse.server_info()
+        default_name = (server.default_sink_name or "").strip()
+
+        # I build each sort key once alongside its SinkInfo instead of per comparison.
+        decorated: List[Tuple[Tuple[bool, str, str], SinkInfo]] = []
+        for s in pulse.sink_list():
+            v = is_virtual_sink(s)
+            desc = s.description or s.name
+            info = SinkInfo(
+                name=s.name,
+                description=desc,
+                is_virtual=v,
+                is_default=(s.name == default_name),
+            )
+            decorated.append(((not v, desc.lower(), s.name.lower()), info))
+        decorated.sort(key=lambda t: t[0])
+        out = [info for _, info in decorated]
+
+        _remember_suggested_name(s.name for s in out)
+        return out
 
     def can_spawn_patchbay(self) -> bool:
         return True
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Optional, Tuple
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
 
+import functools
 import os
 import re
 import subprocess
@@ -12,11 +13,31 @@ import time
 import urllib.parse
 import webbrowser
 
-from PySide6.QtCore import QObject, QTimer, QUrl, Qt, Signal, QSettings
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+from PySide6.QtCore import QObject, QStandardPaths, QUrl, Qt, Signal, QSettings
+from PySide6.QtGui import QDesktopServices
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkDiskCache, QNetworkReply, QNetworkRequest
 from PySide6.QtWidgets import QApplication, QCheckBox, QMessageBox, QWidget
 
 
+_VERSION_SPLIT_RE = re.compile(r"[.\-_+]")
+# One descriptor line: "version | os | download" or "version | os | flags | download", with optional
+# "# comment". Fields never span "|", "#" or line breaks, so comment and blank lines never match and
+# anything after the fourth field is ignored.
+_DESCRIPTOR_LINE_RE = re.compile(
+    r"^([^|#\r\n]*)\|([^|#\r\n]*)\|([^|#\r\n]*)(?:\|([^|#\r\n]*))?",
+    re.MULTILINE,
+)
+# Line breaks other than "\n" that str.splitlines() honours; descriptors containing any get normalized first.
+_OTHER_LINE_BREAKS_RE = re.compile("[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+_HTTP_RE = re.compile(r"^https?://", re.IGNORECASE)
+_GITHUB_REPO_RE = re.compile(r"^https?://github\.com/([^/]+)/([^/]+)", re.IGNORECASE)
+
+
+STARTUP_CHECK_INTERVAL_S = 6 * 3600
+
+_SETTINGS_CACHE: Dict[Tuple[str, str], QSettings] = {}
+
+
 @dataclass(frozen=True)
 class ReProject:
     owner: str
@@ -42,10 +63,19 @@ class ReProject:
     def descriptor_url(self) -> str:
         return f"{self.repo_url()}/raw/refs/heads/{self.branch}/{self.descriptor_path}"
 
-    def settings(self) -> QSettings:
+    def settings_key(self) -> Tuple[str, str]:
         org = (self.settings_org or self.owner or "reupdater").strip()
         app = (self.settings_app or self.repo or "app").strip()
-        return QSettings(org, app)
+        return org, app
+
+    def settings(self) -> QSettings:
+        org, app = self.settings_key()
+        # I share one QSettings per (org, app) so repeated reads/writes do not reopen the backing store.
+        s = _SETTINGS_CACHE.get((org, app))
+        if s is None:
+            s = QSettings(org, app)
+            _SETTINGS_CACHE[(org, app)] = s
+        return s
 
 
 @dataclass(frozen=True)
@@ -84,27 +114,41 @@ def normalize_os_tag(tag: str) -> str:
     return t
 
 
+# Raw descriptor os tags (lowercased) that normalize_os_tag() maps onto a given normalized tag.
+_OS_ALIASES: Dict[str, FrozenSet[str]] = {
+    "macos": frozenset(("macos", "darwin", "mac")),
+}
+
+_OS_TAG = normalize_os_tag(detect_os_tag())
+
+
+@functools.lru_cache(maxsize=512)
 def _version_key(v: str) -> Tuple[int, ...]:
     s = (v or "").strip()
     if s.startswith(("v", "V")):
         s = s[1:]
-    parts = [p for p in re.split(r"[.\-_+]", s) if p.strip() != ""]
+    # Separator-only input is the only way to get no parts, so (0,) covers the old digit-scan fallback.
     out = []
-    for p in parts:
-        m = re.match(r"^\d+$", p.strip())
-        out.append(int(p) if m else 0)
-    if not out:
-        nums = re.findall(r"\d+", s)
-        out = [int(x) for x in nums] if nums else [0]
-    return tuple(out)
+    for p in _VERSION_SPLIT_RE.split(s):
+        p = p.strip()
+        if p:
+            out.append(int(p) if p.isdecimal() else 0)
+    return tuple(out) or (0,)
+
+
+@functools.lru_cache(maxsize=512)
+def _version_cmp_key(v: str) -> Tuple[int, ...]:
+    # Trailing zeros are dropped so plain tuple comparison matches zero-padded comparison (1.2 == 1.2.0).
+    k = _version_key(v)
+    n = len(k)
+    while n > 0 and k[n - 1] == 0:
+        n -= 1
+    return k[:n]
 
 
 def compare_versions(a: str, b: str) -> int:
-    ta = _version_key(a)
-    tb = _version_key(b)
-    n = max(len(ta), len(tb))
-    ta = ta + (0,) * (n - len(ta))
-    tb = tb + (0,) * (n - len(tb))
+    ta = _version_cmp_key(a)
+    tb = _version_cmp_key(b)
     return -1 if ta < tb else (1 if ta > tb else 0)
 
 
@@ -113,39 +157,34 @@ def parse_descriptor(text: str, *, os_tag: str, current_version: str) -> Tuple[O
     current: Optional[UpdateEntry] = None
 
     want = normalize_os_tag(os_tag)
-    cur = (current_version or "").strip()
-
-    for raw in (text or "").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
+    aliases = _OS_ALIASES.get(want) or frozenset((want,))
+    cur_key = _version_cmp_key((current_version or "").strip())
+    latest_key: Tuple[int, ...] = ()
+
+    text = text or ""
+    if _OTHER_LINE_BREAKS_RE.search(text):
+        text = "\n".join(text.splitlines())
+    for m in _DESCRIPTOR_LINE_RE.finditer(text):
+        ver_raw, os_raw, third, fourth = m.groups()
+
+        ver = ver_raw.strip()
+        if not ver or os_raw.strip().lower() not in aliases:
             continue
-        if "#" in line:
-            line = line.split("#", 1)[0].strip()
-            if not line:
-                continue
 
-        parts = [p.strip() for p in line.split("|")]
-        if len(parts) < 3:
-            continue
-
-        ver = parts[0]
-        os_name = normalize_os_tag(parts[1])
-        if not ver or os_name != want:
-            continue
-
-        if len(parts) == 3:
-            flags: Tuple[str, ...] = ()
-            dl = parts[2]
+        if fourth is not None:
+            flags: Tuple[str, ...] = tuple(f.lower() for f in third.replace(",", " ").split())
+            dl = fourth
         else:
-            flags = tuple(f.strip().lower() for f in re.split(r"[,\s]+", parts[2]) if f.strip())
-            dl = parts[3] if len(parts) >= 4 else ""
+            flags = ()
+            dl = third
 
-        e = UpdateEntry(version=ver.strip(), os_tag=os_name, flags=flags, download=(dl or "").strip())
+        e = UpdateEntry(version=ver, os_tag=want, flags=flags, download=dl.strip())
 
-        if latest is None or compare_versions(e.version, latest.version) > 0:
-            latest = e
+        ek = _version_cmp_key(e.version)
+        if latest is None or ek > latest_key:
+            latest, latest_key = e, ek
 
-        if compare_versions(e.version, cur) == 0:
+        if ek == cur_key:
             current = e
 
     return latest, current
@@ -156,7 +195,7 @@ def build_download_url(project: ReProject, entry: UpdateEntry) -> str:
     if not s:
         return ""
 
-    if re.match(r"^https?://", s, re.IGNORECASE):
+    if _HTTP_RE.match(s):
         return s
 
     spec = s.lstrip("/")
@@ -175,19 +214,32 @@ def build_download_url(project: ReProject, entry: UpdateEntry) -> str:
     return f"{project.repo_url()}/releases/download/{tag_q}/{asset_q}"
 
 
+_QT_LAUNCH_ENV_KEYS = (
+    "QT_QPA_PLATFORMTHEME",
+    "QT_QPA_PLATFORM",
+    "QT_PLUGIN_PATH",
+    "QT_DEBUG_PLUGINS",
+    "QT_LOGGING_RULES",
+    "QML2_IMPORT_PATH",
+    "QML_IMPORT_PATH",
+)
+
+
+@functools.lru_cache(maxsize=1)
 def _clean_env_for_external_launch() -> dict[str, str]:
-    env = dict(os.environ)
-    for k in (
-        "QT_QPA_PLATFORMTHEME",
-        "QT_QPA_PLATFORM",
-        "QT_PLUGIN_PATH",
-        "QT_DEBUG_PLUGINS",
-        "QT_LOGGING_RULES",
-        "QML2_IMPORT_PATH",
-        "QML_IMPORT_PATH",
-    ):
-        env.pop(k, None)
-    return env
+    # I build this once; the launch environment is fixed for the app's lifetime. Callers must not mutate it.
+    return {k: v for k, v in os.environ.items() if k not in _QT_LAUNCH_ENV_KEYS}
+
+
+def _open_url_qt(u: str) -> bool:
+    # On Linux, Qt may hand the URL to xdg-open with our own environment; if Qt variables are set
+    # (bundled builds), I use the scrubbed subprocess path so they do not leak into the browser.
+    if sys.platform.startswith("linux") and any(k in os.environ for k in _QT_LAUNCH_ENV_KEYS):
+        return False
+    try:
+        return bool(QDesktopServices.openUrl(QUrl(u)))
+    except Exception:
+        return False
 
 
 def open_url_external(url: str) -> None:
@@ -195,6 +247,9 @@ def open_url_external(url: str) -> None:
     if not u:
         return
 
+    if _open_url_qt(u):
+        return
+
     env = _clean_env_for_external_launch()
 
     if sys.platform.startswith("linux"):
@@ -251,8 +306,10 @@ def get_skip_version(project: ReProject) -> str:
     try:
         s = project.settings()
         s.beginGroup("reupdater")
-        v = str(s.value("skip_version", "") or "")
-        s.endGroup()
+        try:
+            v = str(s.value("skip_version", "") or "")
+        finally:
+            s.endGroup()
         return v.strip()
     except Exception:
         return ""
@@ -262,8 +319,11 @@ def set_skip_version(project: ReProject, version: Optional[str]) -> None:
     try:
         s = project.settings()
         s.beginGroup("reupdater")
-        s.setValue("skip_version", (version or "").strip())
-        s.endGroup()
+        try:
+            s.setValue("skip_version", (version or "").strip())
+        finally:
+            s.endGroup()
+        s.sync()
     except Exception:
         pass
 
@@ -272,12 +332,61 @@ def record_last_check(project: ReProject) -> None:
     try:
         s = project.settings()
         s.beginGroup("reupdater")
-        s.setValue("last_check_unix", int(time.time()))
-        s.endGroup()
+        try:
+            s.setValue("last_check_unix", int(time.time()))
+        finally:
+            s.endGroup()
+        s.sync()
+    except Exception:
+        pass
+
+
+def record_last_result(project: ReProject, latest: UpdateEntry, download_url: str, current_deprecated: bool) -> None:
+    """
+    I remember the outcome of the last successful descriptor check for check_startup's debounce.
+    """
+    try:
+        s = project.settings()
+        s.beginGroup("reupdater")
+        try:
+            s.setValue("last_result_unix", int(time.time()))
+            s.setValue("last_checked_version", str(project.version).strip())
+            s.setValue("last_latest_version", latest.version)
+            s.setValue("last_dl_url", download_url)
+            s.setValue("last_current_deprecated", 1 if current_deprecated else 0)
+        finally:
+            s.endGroup()
+        s.sync()
     except Exception:
         pass
 
 
+def get_last_result(project: ReProject, max_age_s: float) -> Optional[Tuple[str, str, bool]]:
+    """
+    I return (latest_version, download_url, current_deprecated) from the last successful check,
+    or None if it is older than max_age_s or was made by a different app version.
+    """
+    try:
+        s = project.settings()
+        s.beginGroup("reupdater")
+        try:
+            stamp = int(s.value("last_result_unix", 0) or 0)
+            checked = str(s.value("last_checked_version", "") or "").strip()
+            latest = str(s.value("last_latest_version", "") or "").strip()
+            dl_url = str(s.value("last_dl_url", "") or "").strip()
+            deprecated = int(s.value("last_current_deprecated", 0) or 0) != 0
+        finally:
+            s.endGroup()
+    except Exception:
+        return None
+
+    if not latest or checked != str(project.version).strip():
+        return None
+    if not (0 <= time.time() - stamp < max_age_s):
+        return None
+    return latest, dl_url, deprecated
+
+
 class UpdateClient(QObject):
     checked = Signal(object)
 
@@ -297,7 +406,7 @@ class UpdateClient(QObject):
 
         self._parent = parent
         self._project = project
-        self._os_tag = normalize_os_tag(os_tag or detect_os_tag())
+        self._os_tag = normalize_os_tag(os_tag) if os_tag else _OS_TAG
         self._descriptor_url = (descriptor_url or project.descriptor_url()).strip()
 
         self._get_skip = get_skip or (lambda: get_skip_version(project))
@@ -309,13 +418,37 @@ class UpdateClient(QObject):
         self._mgr = QNetworkAccessManager(self)
         self._mgr.finished.connect(self._on_reply)
 
+        # I keep an HTTP disk cache so an unchanged descriptor is revalidated (ETag/Last-Modified -> 304)
+        # instead of downloaded again; Qt serves the cached body transparently on a 304.
+        try:
+            base = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+            if base:
+                org, app = project.settings_key()
+                cache = QNetworkDiskCache(self)
+                cache.setCacheDirectory(os.path.join(base, org, app, "reupdater"))
+                self._mgr.setCache(cache)
+        except Exception:
+            pass
+
         self._in_flight = False
         self._ignore_skip = False
         self._show_dialog = False
         self._cb: Optional[Callable[[UpdateResult], None]] = None
 
-    def check_startup(self) -> None:
-        self.check_now(ignore_skip=False, show_dialog=True, callback=None)
+    def check_startup(self, *, min_interval_s: float = STARTUP_CHECK_INTERVAL_S) -> None:
+        # I reuse a recent successful result instead of hitting the network on every launch;
+        # user-triggered check_now() calls are never debounced.
+        cached = get_last_result(self._project, min_interval_s) if min_interval_s > 0 else None
+        if cached is None or self._in_flight:
+            self.check_now(ignore_skip=False, show_dialog=True, callback=None)
+            return
+
+        latest_version, dl_url, cur_deprecated = cached
+        self._ignore_skip = False
+        self._show_dialog = True
+        self._cb = None
+        latest = UpdateEntry(version=latest_version, os_tag=self._os_tag, flags=(), download=dl_url)
+        self._finish_with(latest, dl_url, cur_deprecated)
 
     def check_now(
         self,
@@ -354,33 +487,14 @@ class UpdateClient(QObject):
         self._cb = callback
 
         req = QNetworkRequest(QUrl(self._descriptor_url))
-        try:
-            req.setTransferTimeout(self._timeout_ms)
-        except Exception:
-            pass
-
-        reply = self._mgr.get(req)
-
-        timer = QTimer(self)
-        timer.setSingleShot(True)
-
-        def on_timeout() -> None:
-            try:
-                if reply.isRunning():
-                    reply.abort()
-            except Exception:
-                pass
-
-        def cleanup() -> None:
-            try:
-                timer.stop()
-                timer.deleteLater()
-            except Exception:
-                pass
+        req.setAttribute(
+            QNetworkRequest.Attribute.CacheLoadControlAttribute,
+            QNetworkRequest.CacheLoadControl.PreferNetwork,
+        )
+        req.setTransferTimeout(self._timeout_ms)
 
-        timer.timeout.connect(on_timeout)
-        reply.finished.connect(cleanup)
-        timer.start(self._timeout_ms)
+        # I rely on the transfer timeout; an aborted reply reaches _on_reply as OperationCanceledError.
+        self._mgr.get(req)
 
     def _on_reply(self, reply: QNetworkReply) -> None:
         try:
@@ -401,9 +515,8 @@ class UpdateClient(QObject):
                 self._finish(res)
                 return
 
-            data = reply.readAll()
             try:
-                text = bytes(data).decode("utf-8", errors="replace")
+                text = reply.readAll().data().decode("utf-8", errors="replace")
             except Exception:
                 text = ""
 
@@ -423,65 +536,69 @@ class UpdateClient(QObject):
             dl_url = build_download_url(self._project, latest)
 
             cur_deprecated = bool(current and any(f == "deprecated" for f in current.flags))
-            if cur_deprecated:
-                res = UpdateResult(
-                    status="deprecated",
-                    os_tag=self._os_tag,
-                    current_version=str(self._project.version),
-                    latest=latest,
-                    download_url=dl_url,
-                    message="Current version is deprecated.",
-                )
-                if self._show_dialog:
-                    self._show_mandatory_dialog(res)
-                self._finish(res)
-                return
+            record_last_result(self._project, latest, dl_url, cur_deprecated)
+            self._finish_with(latest, dl_url, cur_deprecated)
 
-            if compare_versions(latest.version, str(self._project.version)) <= 0:
-                res = UpdateResult(
-                    status="no_update",
-                    os_tag=self._os_tag,
-                    current_version=str(self._project.version),
-                    latest=latest,
-                    download_url=dl_url,
-                )
-                self._finish(res)
-                return
-
-            if not self._ignore_skip:
-                try:
-                    skip = (self._get_skip() or "").strip()
-                except Exception:
-                    skip = ""
-                if skip and skip == latest.version.strip():
-                    res = UpdateResult(
-                        status="no_update",
-                        os_tag=self._os_tag,
-                        current_version=str(self._project.version),
-                        latest=latest,
-                        download_url=dl_url,
-                        message="Update is snoozed.",
-                    )
-                    self._finish(res)
-                    return
+        finally:
+            self._in_flight = False
+            try:
+                reply.deleteLater()
+            except Exception:
+                pass
 
+    def _finish_with(self, latest: UpdateEntry, dl_url: str, cur_deprecated: bool) -> None:
+        if cur_deprecated:
             res = UpdateResult(
-                status="update_available",
+                status="deprecated",
                 os_tag=self._os_tag,
                 current_version=str(self._project.version),
                 latest=latest,
                 download_url=dl_url,
+                message="Current version is deprecated.",
             )
             if self._show_dialog:
-                self._show_optional_dialog(res)
+                self._show_mandatory_dialog(res)
             self._finish(res)
+            return
 
-        finally:
-            self._in_flight = False
+        if compare_versions(latest.version, str(self._project.version)) <= 0:
+            res = UpdateResult(
+                status="no_update",
+                os_tag=self._os_tag,
+                current_version=str(self._project.version),
+                latest=latest,
+                download_url=dl_url,
+            )
+            self._finish(res)
+            return
+
+        if not self._ignore_skip:
             try:
-                reply.deleteLater()
+                skip = (self._get_skip() or "").strip()
             except Exception:
-                pass
+                skip = ""
+            if skip and skip == latest.version.strip():
+                res = UpdateResult(
+                    status="no_update",
+                    os_tag=self._os_tag,
+                    current_version=str(self._project.version),
+                    latest=latest,
+                    download_url=dl_url,
+                    message="Update is snoozed.",
+                )
+                self._finish(res)
+                return
+
+        res = UpdateResult(
+            status="update_available",
+            os_tag=self._os_tag,
+            current_version=str(self._project.version),
+            latest=latest,
+            download_url=dl_url,
+        )
+        if self._show_dialog:
+            self._show_optional_dialog(res)
+        self._finish(res)
 
     def _emit(self, res: UpdateResult, cb: Optional[Callable[[UpdateResult], None]]) -> None:
         self.checked.emit(res)
@@ -593,7 +710,7 @@ def project_from_repo(
     settings_app: Optional[str] = None,
 ) -> ReProject:
     u = (repo_url or "").strip()
-    m = re.match(r"^https?://github\.com/([^/]+)/([^/]+)", u, re.IGNORECASE)
+    m = _GITHUB_REPO_RE.match(u)
     if not m:
         raise ValueError(f"Unrecognized GitHub repo URL: {repo_url!r}")
     owner, repo = m.group(1), m.group(2)
@@ -1,9 +1,10 @@
 # source/ui_main_window.py
 from __future__ import annotations
 
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Set
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Qt, Signal
 from PySide6.QtGui import QFont, QIcon
 from PySide6.QtWidgets import (
     QFrame,
@@ -18,16 +19,84 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from app_meta import APP_NAME, REPO_URL, detect_version
+from app_meta import APP_NAME, REPO_URL
 from config_store import ConfigStore
-from dialogs_create_sink import CreateVirtualSinkDialog
-from dialogs_patchbay_settings import PatchbaySettingsDialog
-from patchbay import launch_patchbay, resolve_patchbay_choice
-from rehelp import HelpDialog
-from reupdater import UpdateClient, project_from_repo
 from resink_backend import ReSinkBackend, SinkInfo, destroy_sink_by_name, set_default_sink
-from ui_help_content import help_html
-from ui_rows import SinkRow, SinkRowModel
+from ui_rows import RowSelectionBus, SinkRow, SinkRowModel
+
+if TYPE_CHECKING:
+    from reupdater import ReProject, UpdateClient
+
+
+_PANEL_TITLE_FONT: QFont | None = None
+
+
+def _panel_title_font() -> QFont:
+    global _PANEL_TITLE_FONT
+    if _PANEL_TITLE_FONT is None:
+        f = QFont()
+        f.setPointSize(12)
+        f.setWeight(QFont.DemiBold)
+        _PANEL_TITLE_FONT = f
+    return _PANEL_TITLE_FONT
+
+
+class _BackendTaskSignals(QObject):
+    done = Signal(object)
+    err = Signal(str)
+
+
+class _BackendTask(QRunnable):
+    """
+    I run one blocking backend call (PulseAudio round trips, pw-cli/wpctl subprocesses) on a pool thread
+    and report its result or error message back through signals.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args: Any) -> None:
+        super().__init__()
+        self.signals = _BackendTaskSignals()
+        self._fn = fn
+        self._args = args
+
+    def run(self) -> None:
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            self.signals.err.emit(str(e))
+            return
+        self.signals.done.emit(result)
+
+
+class _DestroyBatchSignals(QObject):
+    progress = Signal(str, str)
+    finished = Signal()
+
+
+class _DestroyBatch(QRunnable):
+    """
+    I destroy a batch of sinks off the UI thread, a few pw-cli calls at a time, reporting
+    (name, error-or-empty) per sink and then finished once.
+    """
+
+    def __init__(self, names: List[str]) -> None:
+        super().__init__()
+        self.signals = _DestroyBatchSignals()
+        self._names = list(names)
+
+    def _destroy_one(self, name: str) -> None:
+        try:
+            destroy_sink_by_name(name)
+        except Exception as e:
+            self.signals.progress.emit(name, str(e) or type(e).__name__)
+            return
+        self.signals.progress.emit(name, "")
+
+    def run(self) -> None:
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(self._destroy_one, self._names))
+        finally:
+            self.signals.finished.emit()
 
 
 class MainWindow(QMainWindow):
@@ -38,19 +107,41 @@ class MainWindow(QMainWindow):
         self.resize(520, 680)
 
         self.backend = ReSinkBackend()
+        self._rows_by_name: Dict[str, SinkRow] = {}
+        self._all_rows: List[SinkRow] = []
+        self._selected: Set[SinkRow] = set()
+
+        # Every row reports selection through this one bus, connected once with a direct connection.
+        self._row_bus = RowSelectionBus(self)
+        self._row_bus.selection_changed.connect(self._on_row_selection_changed, Qt.DirectConnection)
+
+        # I throttle selection-driven action updates (leading + trailing edge, 30 ms) so click bursts
+        # collapse into at most one recompute per interval while the final state is still applied.
+        self._action_states_pending = False
+        self._action_states_timer = QTimer(self)
+        self._action_states_timer.setSingleShot(True)
+        self._action_states_timer.setInterval(30)
+        self._action_states_timer.timeout.connect(self._on_action_states_timer)
+        # (total rows, selected rows) last shown, so unchanged counts skip the label/button updates.
+        self._last_counts: tuple[int, int] | None = None
+
+        # I keep in-flight backend tasks referenced until they report back.
+        self._tasks: Set[QRunnable] = set()
+        # I run at most one sink listing at a time; refreshes requested meanwhile collapse into one follow-up.
+        self._refresh_inflight = False
+        self._refresh_dirty = False
+        self._default_inflight = False
+        self._destroy_inflight = False
+        self._destroy_errors: List[str] = []
         self.store = ConfigStore()
         self.store.ensure_exists()
         # I record my executable path so other apps (like aSyphon) can locate this installed build.
         self.store.record_last_exe_path()
 
-        self._project = project_from_repo(
-            REPO_URL,
-            version=detect_version(),
-            name=APP_NAME,
-            settings_org="Retzilience",
-            settings_app=APP_NAME,
-        )
-        self._updater = UpdateClient(self, self._project)
+        # Help, dialogs, the updater (QtNetwork) and patchbay helpers are imported on first use, so none of
+        # them delay the first paint of the window.
+        self._project: ReProject | None = None
+        self._updater: UpdateClient | None = None
 
         root = QWidget()
         outer = QVBoxLayout()
@@ -70,7 +161,27 @@ class MainWindow(QMainWindow):
 
         self.refresh()
 
+    def closeEvent(self, event) -> None:
+        self.backend.close()
+        super().closeEvent(event)
+
     def _open_help(self) -> None:
+        from rehelp import HelpDialog
+        from ui_help_content import help_html
+
+        if self._project is None or self._updater is None:
+            from app_meta import detect_version
+            from reupdater import UpdateClient, project_from_repo
+
+            self._project = project_from_repo(
+                REPO_URL,
+                version=detect_version(),
+                name=APP_NAME,
+                settings_org="Retzilience",
+                settings_app=APP_NAME,
+            )
+            self._updater = UpdateClient(self, self._project)
+
         dlg = HelpDialog(
             self,
             self._project,
@@ -95,13 +206,13 @@ class MainWindow(QMainWindow):
         help_btn = QPushButton("Help / About")
         help_btn.clicked.connect(self._open_help)
 
-        refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.refresh)
+        self.refresh_btn = QPushButton("Refresh")
+        self.refresh_btn.clicked.connect(self.refresh)
 
         header.addWidget(title, 2)
         header.addWidget(backend, 3)
         header.addWidget(help_btn, 0)
-        header.addWidget(refresh_btn, 0)
+        header.addWidget(self.refresh_btn, 0)
         return header
 
     def _make_panel(self, title: str) -> QFrame:
@@ -117,10 +228,7 @@ class MainWindow(QMainWindow):
         top.setSpacing(10)
 
         t = QLabel(title)
-        f = QFont()
-        f.setPointSize(12)
-        f.setWeight(QFont.DemiBold)
-        t.setFont(f)
+        t.setFont(_panel_title_font())
 
         self._panel_right = QLabel("")
         self._panel_right.setObjectName("Subtle")
@@ -156,14 +264,6 @@ class MainWindow(QMainWindow):
     def _sinks_layout(self) -> QVBoxLayout:
         return self.sinks_list._layout  # type: ignore[attr-defined]
 
-    def _clear_layout(self, lay: QVBoxLayout) -> None:
-        while lay.count():
-            item = lay.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
-                w.deleteLater()
-
     def _make_footer_actions(self) -> QHBoxLayout:
         row = QHBoxLayout()
         row.setSpacing(8)
@@ -199,62 +299,167 @@ class MainWindow(QMainWindow):
 
         return row
 
-    def _rows(self) -> List[SinkRow]:
-        lay = self._sinks_layout()
-        out: List[SinkRow] = []
-        for i in range(lay.count()):
-            w = lay.itemAt(i).widget()
-            if isinstance(w, SinkRow):
-                out.append(w)
-        return out
-
     def _selected_virtual_sinks(self) -> List[SinkRowModel]:
         out: List[SinkRowModel] = []
-        for r in self._rows():
-            m = r.model()
-            if not m:
+        for r in self._all_rows:
+            if r not in self._selected:
                 continue
-            if m.is_virtual and r.is_selected():
+            m = r.model()
+            if m is not None and m.is_virtual:
                 out.append(m)
         return out
 
+    def _on_row_selection_changed(self, row: SinkRow, selected: bool) -> None:
+        if selected:
+            self._selected.add(row)
+        else:
+            self._selected.discard(row)
+        self._schedule_action_states()
+
+    def _schedule_action_states(self) -> None:
+        if self._action_states_timer.isActive():
+            self._action_states_pending = True
+            return
+        self._update_action_states()
+        self._action_states_timer.start()
+
+    def _on_action_states_timer(self) -> None:
+        if self._action_states_pending:
+            self._action_states_pending = False
+            self._update_action_states()
+            self._action_states_timer.start()
+
     def _update_action_states(self) -> None:
-        sel = self._selected_virtual_sinks()
-        n = len(sel)
+        n = len(self._selected)
+        total_rows = len(self._all_rows)
+
+        counts = (total_rows, n)
+        if counts == self._last_counts:
+            return
+        self._last_counts = counts
 
-        total_rows = len(self._rows())
         self._panel_right.setText(f"{total_rows} items • {n} selected")
 
-        self.destroy_btn.setEnabled(n > 0)
-        self.default_btn.setEnabled(n == 1)
+        destroy_enabled = n > 0 and not self._destroy_inflight
+        if self.destroy_btn.isEnabled() != destroy_enabled:
+            self.destroy_btn.setEnabled(destroy_enabled)
+        default_enabled = n == 1 and not self._default_inflight
+        if self.default_btn.isEnabled() != default_enabled:
+            self.default_btn.setEnabled(default_enabled)
 
     def _rebuild_sink_rows(self, sinks: List[SinkInfo]) -> None:
+        """
+        I diff the incoming sinks against the existing rows (keyed by sink name): rows are reused and only
+        re-modelled when their data changed, and only added/removed sinks create or destroy widgets.
+        """
         lay = self._sinks_layout()
-        self._clear_layout(lay)
-
-        for s in sinks:
-            row = SinkRow()
-            row.set_model(
-                SinkRowModel(
-                    name=s.name,
-                    description=s.description,
-                    is_virtual=s.is_virtual,
-                    is_default=s.is_default,
-                )
-            )
-            row.selection_changed.connect(self._update_action_states)
-            lay.addWidget(row)
+        container = self.sinks_list._container  # type: ignore[attr-defined]
+
+        # I freeze painting and relayout while rows are added/moved/re-modelled, so Qt lays the list out
+        # and repaints it once at the end.
+        container.setUpdatesEnabled(False)
+        lay.setEnabled(False)
+        try:
+            self._apply_sink_rows(lay, sinks)
+        finally:
+            lay.setEnabled(True)
+            lay.activate()
+            container.setUpdatesEnabled(True)
 
         self._update_action_states()
 
+    def _apply_sink_rows(self, lay: QVBoxLayout, sinks: List[SinkInfo]) -> None:
+        models = [
+            SinkRowModel(
+                name=s.name,
+                description=s.description,
+                is_virtual=s.is_virtual,
+                is_default=s.is_default,
+            )
+            for s in sinks
+        ]
+        incoming = {m.name for m in models}
+
+        for name in [n for n in self._rows_by_name if n not in incoming]:
+            row = self._rows_by_name.pop(name)
+            self._selected.discard(row)
+            lay.removeWidget(row)
+            row.setParent(None)
+            row.deleteLater()
+
+        for pos, m in enumerate(models):
+            row = self._rows_by_name.get(m.name)
+            if row is None:
+                row = SinkRow(self._row_bus)
+                row.set_model(m)
+                self._rows_by_name[m.name] = row
+                lay.insertWidget(pos, row)
+                continue
+
+            if row.model() != m:
+                row.set_model(m)
+            if lay.indexOf(row) != pos:
+                lay.removeWidget(row)
+                lay.insertWidget(pos, row)
+
+        self._all_rows = [self._rows_by_name[m.name] for m in models]
+        # set_model() clears the selection of rows that turned physical.
+        self._selected = {r for r in self._selected if r.is_selected()}
+
+    def _start_task(
+        self,
+        task: _BackendTask,
+        on_done: Callable[[Any], None],
+        on_err: Callable[[str], None],
+    ) -> None:
+        def finish() -> None:
+            self._tasks.discard(task)
+
+        task.signals.done.connect(on_done, Qt.QueuedConnection)
+        task.signals.err.connect(on_err, Qt.QueuedConnection)
+        task.signals.done.connect(finish, Qt.QueuedConnection)
+        task.signals.err.connect(finish, Qt.QueuedConnection)
+        self._tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
     def refresh(self) -> None:
+        # I list sinks on a pool thread so a slow PulseAudio server never stalls the event loop.
+        if self._refresh_inflight:
+            self._refresh_dirty = True
+            return
+        self._refresh_dirty = False
+        self._refresh_inflight = True
+        self.refresh_btn.setEnabled(False)
+        self._start_task(_BackendTask(self.backend.list_sinks), self._on_sinks_listed, self._on_sinks_error)
+
+    def _refresh_finished(self) -> bool:
+        """
+        I return True when another refresh was requested meanwhile and has been started, in which case
+        the finished (now stale) result is dropped.
+        """
+        self._refresh_inflight = False
+        if self._refresh_dirty:
+            self.refresh()
+            return True
+        self.refresh_btn.setEnabled(True)
+        return False
+
+    def _on_sinks_listed(self, sinks: List[SinkInfo]) -> None:
+        if self._refresh_finished():
+            return
         try:
-            sinks = self.backend.list_sinks()
             self._rebuild_sink_rows(sinks)
         except Exception as e:
             QMessageBox.critical(self, "Backend error", str(e))
 
+    def _on_sinks_error(self, msg: str) -> None:
+        if self._refresh_finished():
+            return
+        QMessageBox.critical(self, "Backend error", msg)
+
     def _create_sink(self) -> None:
+        from dialogs_create_sink import CreateVirtualSinkDialog
+
         dlg = CreateVirtualSinkDialog(self)
         if dlg.exec():
             self.refresh()
@@ -274,14 +479,30 @@ class MainWindow(QMainWindow):
         if ok != QMessageBox.StandardButton.Yes:
             return
 
-        errors: List[str] = []
-        for m in sel:
-            try:
-                destroy_sink_by_name(m.name)
-            except Exception as e:
-                errors.append(f"{m.name}: {e}")
+        batch = _DestroyBatch([m.name for m in sel])
+        batch.signals.progress.connect(self._on_destroy_progress, Qt.QueuedConnection)
+        batch.signals.finished.connect(lambda: self._on_destroy_finished(batch), Qt.QueuedConnection)
+
+        self._destroy_errors = []
+        self._set_destroy_inflight(True)
+        self._tasks.add(batch)
+        QThreadPool.globalInstance().start(batch)
+
+    def _set_destroy_inflight(self, v: bool) -> None:
+        self._destroy_inflight = v
+        self._last_counts = None
+        self._update_action_states()
+
+    def _on_destroy_progress(self, name: str, error: str) -> None:
+        if error:
+            self._destroy_errors.append(f"{name}: {error}")
 
+    def _on_destroy_finished(self, batch: _DestroyBatch) -> None:
+        self._tasks.discard(batch)
+        self._set_destroy_inflight(False)
         self.refresh()
+
+        errors, self._destroy_errors = self._destroy_errors, []
         if errors:
             QMessageBox.critical(self, "Destroy issues", "\n".join(errors))
 
@@ -294,20 +515,31 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Make default", "Select exactly one virtual sink.")
             return
 
-        m = sel[0]
-        try:
-            set_default_sink(m.name)
-        except Exception as e:
-            QMessageBox.critical(self, "Make default", str(e))
-            return
+        self._set_default_inflight(True)
+        self._start_task(_BackendTask(set_default_sink, sel[0].name), self._on_default_set, self._on_default_error)
 
+    def _set_default_inflight(self, v: bool) -> None:
+        self._default_inflight = v
+        self._last_counts = None
+        self._update_action_states()
+
+    def _on_default_set(self, _result: object) -> None:
+        self._set_default_inflight(False)
         self.refresh()
 
+    def _on_default_error(self, msg: str) -> None:
+        self._set_default_inflight(False)
+        QMessageBox.critical(self, "Make default", msg)
+
     def _patchbay_settings(self) -> None:
+        from dialogs_patchbay_settings import PatchbaySettingsDialog
+
         dlg = PatchbaySettingsDialog(self.store, self)
         dlg.exec()
 
     def _open_patchbay(self) -> None:
+        from patchbay import launch_patchbay, resolve_patchbay_choice
+
         choice = resolve_patchbay_choice(self.store)
         if choice is None:
             QMessageBox.information(
@@ -2,12 +2,25 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QObject, Qt, Signal
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
 from widgets import ElideLabel
 
 
+def _set_prop_if_changed(w: QWidget, key: str, val) -> bool:
+    # Qt re-resolves property-dependent QSS even for no-op assignments, so I compare first.
+    if w.property(key) == val:
+        return False
+    w.setProperty(key, val)
+    return True
+
+
+def _repolish(w: QWidget) -> None:
+    w.style().unpolish(w)
+    w.style().polish(w)
+
+
 @dataclass(frozen=True)
 class SinkRowModel:
     name: str
@@ -16,11 +29,20 @@ class SinkRowModel:
     is_default: bool
 
 
+class RowSelectionBus(QObject):
+    """
+    I carry (row, selected) for every row of a list, so the owner connects once instead of once per row.
+    """
+
+    selection_changed = Signal(object, bool)
+
+
 class SinkRow(QWidget):
-    selection_changed = Signal()
+    selection_changed = Signal(bool)
 
-    def __init__(self) -> None:
+    def __init__(self, bus: RowSelectionBus | None = None) -> None:
         super().__init__()
+        self._bus = bus
 
         self.setObjectName("RowCard")
         self.setProperty("kind", "physical")
@@ -28,6 +50,7 @@ class SinkRow(QWidget):
         self.setProperty("default", False)
 
         self._model: SinkRowModel | None = None
+        self._is_virtual = False
         self._selected = False
 
         self.desc_lbl = ElideLabel()
@@ -43,7 +66,7 @@ class SinkRow(QWidget):
         self.name_lbl.setAlignment(Qt.AlignCenter)
         self.name_lbl.setObjectName("SinkName")
 
-        self.select_bar = QLabel("")
+        self.select_bar = QLabel("Not Selected")
         self.select_bar.setObjectName("SelectBar")
         self.select_bar.setAlignment(Qt.AlignCenter)
         self.select_bar.setProperty("sel", False)
@@ -70,7 +93,7 @@ class SinkRow(QWidget):
     def set_selected(self, v: bool) -> None:
         if self._model is None:
             return
-        if not self._model.is_virtual:
+        if not self._is_virtual:
             self._selected = False
             self._sync_state()
             return
@@ -79,60 +102,67 @@ class SinkRow(QWidget):
         self._sync_state()
 
     def mouseReleaseEvent(self, event) -> None:
-        if event.button() == Qt.MouseButton.LeftButton:
-            if self._model is not None and self._model.is_virtual:
-                self._selected = not self._selected
-                self._sync_state()
-                self.selection_changed.emit()
-                event.accept()
-                return
+        if self._is_virtual and event.button() == Qt.MouseButton.LeftButton:
+            self._selected = not self._selected
+            self._sync_state()
+            if self._bus is not None:
+                self._bus.selection_changed.emit(self, self._selected)
+            else:
+                self.selection_changed.emit(self._selected)
+            event.accept()
+            return
         super().mouseReleaseEvent(event)
 
     def set_model(self, m: SinkRowModel) -> None:
         self._model = m
+        self._is_virtual = bool(m.is_virtual)
 
         self.desc_lbl.setText(m.description)
         self.name_lbl.setText(m.name)
 
         kind = "virtual" if m.is_virtual else "physical"
-        self.setProperty("kind", kind)
-        self.setProperty("default", bool(m.is_default))
+        row_changed = _set_prop_if_changed(self, "kind", kind)
+        if _set_prop_if_changed(self, "default", bool(m.is_default)):
+            row_changed = True
+            # The default highlight is a descendant rule on the title, which repolishing the row alone
+            # does not re-resolve.
+            _repolish(self.desc_lbl)
+        pill_changed = _set_prop_if_changed(self.kind_pill, "kind", kind)
 
         if m.is_virtual:
             self.kind_pill.setText("VIRTUAL")
-            self.kind_pill.setProperty("kind", "virtual")
             self.select_bar.setVisible(True)
             self.setCursor(Qt.PointingHandCursor)
         else:
             self.kind_pill.setText("PHYSICAL")
-            self.kind_pill.setProperty("kind", "physical")
             self.select_bar.setVisible(False)
             self._selected = False
             self.setCursor(Qt.ArrowCursor)
 
         self.setToolTip(f"{m.description}\n{m.name}")
-        self._sync_state()
+        self._sync_state(row_changed, pill_changed)
 
-    def _sync_state(self) -> None:
-        m = self._model
-        if m is None:
+    def _sync_state(self, row_changed: bool = False, pill_changed: bool = False) -> None:
+        """
+        I only repolish the widgets whose style properties actually changed; callers pass in changes
+        they already made to the row and the kind pill.
+        """
+        if self._model is None:
             return
 
-        if m.is_virtual:
-            self.setProperty("selected", bool(self._selected))
-            self.select_bar.setProperty("sel", bool(self._selected))
-            self.select_bar.setText("Selected" if self._selected else "Not Selected")
-        else:
-            self.setProperty("selected", False)
-
-        self.style().unpolish(self)
-        self.style().polish(self)
-
-        self.kind_pill.style().unpolish(self.kind_pill)
-        self.kind_pill.style().polish(self.kind_pill)
-
-        if m.is_virtual:
-            self.select_bar.style().unpolish(self.select_bar)
-            self.select_bar.style().polish(self.select_bar)
-
-        self.update()
+        selected = bool(self._selected) and self._is_virtual
+        row_changed |= _set_prop_if_changed(self, "selected", selected)
+        if row_changed:
+            _repolish(self)
+        if pill_changed:
+            _repolish(self.kind_pill)
+
+        bar_changed = False
+        if self._is_virtual:
+            bar_changed = _set_prop_if_changed(self.select_bar, "sel", selected)
+            if bar_changed:
+                self.select_bar.setText("Selected" if selected else "Not Selected")
+                _repolish(self.select_bar)
+
+        if row_changed or pill_changed or bar_changed:
+            self.update()
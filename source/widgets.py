@@ -1,9 +1,9 @@
 # source/widgets.py
 from __future__ import annotations
 
-from PySide6.QtCore import QEasingCurve, Property, QRectF, QSize, Qt, QPropertyAnimation
+from PySide6.QtCore import QEasingCurve, QEvent, Property, QRectF, QSize, Qt, QPropertyAnimation
 from PySide6.QtGui import QColor, QFontMetrics, QPainter, QPen
-from PySide6.QtWidgets import QAbstractButton, QLabel
+from PySide6.QtWidgets import QAbstractButton, QFrame, QLabel
 
 
 class ToggleSwitch(QAbstractButton):
@@ -30,17 +30,33 @@ class ToggleSwitch(QAbstractButton):
         return QSize(46, 24)
 
     def _on_toggled(self, checked: bool) -> None:
+        target = 1.0 if checked else 0.0
+        if self._anim.state() == QPropertyAnimation.Running:
+            if self._anim.endValue() == target:
+                return
+        elif self._offset == target:
+            return
         self._anim.stop()
         self._anim.setStartValue(self._offset)
-        self._anim.setEndValue(1.0 if checked else 0.0)
+        self._anim.setEndValue(target)
         self._anim.start()
 
+    def _knob_px(self, offset: float) -> int:
+        # The knob travel in whole pixels, matching the geometry used by paintEvent().
+        h = self.height() - 1.0
+        travel = (self.width() - 1.0) - 2 * 3.0 - (h - 2 * 3.0)
+        return round(offset * travel)
+
     def get_offset(self) -> float:
         return self._offset
 
     def set_offset(self, v: float) -> None:
-        self._offset = float(v)
-        self.update()
+        v = float(v)
+        # I always repaint the resting positions so the knob settles exactly, not just within a pixel.
+        moved = v in (0.0, 1.0) or self._knob_px(v) != self._knob_px(self._offset)
+        self._offset = v
+        if moved:
+            self.update()
 
     offset = Property(float, get_offset, set_offset)
 
@@ -67,26 +83,17 @@ class ToggleSwitch(QAbstractButton):
         p.end()
 
 
-class StatusPill(QLabel):
-    def __init__(self, parent=None) -> None:
-        super().__init__(parent)
-        self.setAlignment(Qt.AlignCenter)
-        self.setFixedWidth(110)
-        self.setText("—")
-        self.set_state("off")
+# state -> (background, border, foreground); unknown states fall back to "off".
+_PILL_COLORS: dict[str, tuple[str, str, str]] = {
+    "on": ("#23314a", "#3b4f7a", "#d6e2ff"),
+    "pending": ("#3a3424", "#7a6231", "#f3e6c8"),
+    "error": ("#3a2424", "#7a3131", "#f3c8c8"),
+    "off": ("#2a2a30", "#3a3a42", "#d6d6d6"),
+}
 
-    def set_state(self, state: str) -> None:
-        if state == "on":
-            bg, bd, fg = "#23314a", "#3b4f7a", "#d6e2ff"
-        elif state == "pending":
-            bg, bd, fg = "#3a3424", "#7a6231", "#f3e6c8"
-        elif state == "error":
-            bg, bd, fg = "#3a2424", "#7a3131", "#f3c8c8"
-        else:
-            bg, bd, fg = "#2a2a30", "#3a3a42", "#d6d6d6"
-
-        self.setStyleSheet(
-            f"""
+
+def _pill_stylesheet(bg: str, bd: str, fg: str) -> str:
+    return f"""
             QLabel {{
                 background: {bg};
                 border: 1px solid {bd};
@@ -96,7 +103,27 @@ class StatusPill(QLabel):
                 font-weight: 600;
             }}
             """
-        )
+
+
+class StatusPill(QLabel):
+    # I resolve the four stylesheets once; set_state() only swaps between them.
+    _STYLES: dict[str, str] = {state: _pill_stylesheet(*colors) for state, colors in _PILL_COLORS.items()}
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setAlignment(Qt.AlignCenter)
+        self.setFixedWidth(110)
+        self.setText("—")
+        self._state: str | None = None
+        self.set_state("off")
+
+    def set_state(self, state: str) -> None:
+        if state not in self._STYLES:
+            state = "off"
+        if state == self._state:
+            return
+        self._state = state
+        self.setStyleSheet(self._STYLES[state])
 
     def setTextAndState(self, text: str, state: str) -> None:
         self.setText(text)
@@ -108,12 +135,41 @@ class ElideLabel(QLabel):
         super().__init__(parent)
         self.setTextInteractionFlags(Qt.TextSelectableByMouse)
 
+        # I keep one QFontMetrics per label (refreshed on font changes) and the elided string for the
+        # current (text, width), so plain repaints do no font-engine work.
+        self._fm = QFontMetrics(self.font())
+        self._elide_key: tuple[str, int] | None = None
+        self._elide_val = ""
+
+    def changeEvent(self, event) -> None:
+        if event.type() == QEvent.FontChange:
+            self._fm = QFontMetrics(self.font())
+            self._elide_key = None
+        super().changeEvent(event)
+
+    def _elided_text(self) -> str:
+        key = (self.text(), self.width())
+        if key != self._elide_key:
+            self._elide_val = self._fm.elidedText(key[0], Qt.ElideRight, max(10, key[1] - 6))
+            self._elide_key = key
+        return self._elide_val
+
     def paintEvent(self, event) -> None:
-        fm = QFontMetrics(self.font())
-        txt = fm.elidedText(self.text(), Qt.ElideRight, max(10, self.width() - 6))
-        old = self.text()
-        try:
-            self.setText(txt)
+        # While a mouse selection exists I let QLabel paint the full text so the highlight is visible and
+        # matches what gets copied; otherwise I draw the cached elided string myself.
+        if self.hasSelectedText():
             super().paintEvent(event)
-        finally:
-            self.setText(old)
+            return
+
+        QFrame.paintEvent(self, event)
+        p = QPainter(self)
+        self.style().drawItemText(
+            p,
+            self.contentsRect(),
+            self.alignment(),
+            self.palette(),
+            self.isEnabled(),
+            self._elided_text(),
+            self.foregroundRole(),
+        )
+        p.end()